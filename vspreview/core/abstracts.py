@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import logging
 from abc import abstractmethod
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Sequence, TypeAlias, cast, overload
+from os import environ
+from types import BuiltinMethodType
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Literal, MutableMapping, Sequence, TypeAlias, cast, overload
+)
+from weakref import WeakKeyDictionary, ref
 
 from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut
@@ -42,7 +48,7 @@ __all__ = [
 
     'AbstractToolbar', 'AbstractToolbarSettings',
 
-    'main_window', 'storage_err_msg', 'try_load',
+    'main_window', 'register_main_window', 'storage_err_msg', 'try_load', 'try_load_setter',
 ]
 
 
@@ -277,15 +283,19 @@ class AbstractQItem:
     storable_attrs: ClassVar[tuple[str, ...]] = ()
 
     def set_qobject_names(self) -> None:
+        # object names are only read by the debug helpers, set VSPREVIEW_QOBJECT_NAMES to get them
+        if not environ.get('VSPREVIEW_QOBJECT_NAMES'):
+            return
+
         if not hasattr(self, '__slots__'):
             return
 
-        slots = list(self.__slots__)
+        skip_main = isinstance(self, AbstractToolbar)
 
-        if isinstance(self, AbstractToolbar) and 'main' in slots:
-            slots.remove('main')
+        for attr_name in self.__slots__:
+            if skip_main and attr_name == 'main':
+                continue
 
-        for attr_name in slots:
             attr = getattr(self, attr_name)
             if not isinstance(attr, QObject):
                 continue
@@ -502,10 +512,24 @@ class AbstractToolbar(ExtendedWidget, NotchProvider):
         try_load(state, 'settings', AbstractToolbarSettings, self.__setattr__)
 
 
-@lru_cache()
+_main_window: MainWindow | None = None
+
+
+def register_main_window(window: MainWindow) -> None:
+    global _main_window
+
+    _main_window = window
+
+
 def main_window() -> MainWindow:
-    import logging
+    if _main_window is not None:
+        return _main_window
+
+    return _find_main_window()
+
 
+@lru_cache()
+def _find_main_window() -> MainWindow:
     from ..main.window import MainWindow
 
     app = QApplication.instance()
@@ -542,6 +566,66 @@ def storage_err_msg(name: str, level: int = 0) -> str:
     return f'Storage loading ({caller_name}): failed to parse {pretty_name}. Using default.'
 
 
+# python callables are keyed by their function, bound builtins (Qt setters) by their class and name
+_receiver_arities = WeakKeyDictionary[Callable[..., Any], int]()
+_builtin_receiver_arities = dict[tuple[type, str], int]()
+
+
+def _receiver_arity_cache(receiver: Callable[..., Any]) -> tuple[MutableMapping[Any, int], Any]:
+    if (func := getattr(receiver, '__func__', None)) is not None:
+        return _receiver_arities, func
+
+    if isinstance(receiver, BuiltinMethodType) and receiver.__self__ is not None:
+        return _builtin_receiver_arities, (type(receiver.__self__), receiver.__name__)
+
+    try:
+        ref(receiver)
+    except TypeError:
+        # not cacheable, hand out a throwaway cache
+        return {}, None
+
+    return _receiver_arities, receiver
+
+
+def _receiver_arity(receiver: Callable[..., Any]) -> int | None:
+    from inspect import Parameter, signature
+
+    try:
+        parameters = signature(receiver).parameters.values()
+    except ValueError:
+        return None
+
+    return min(2, len([
+        x for x in parameters
+        if x.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    ]))
+
+
+def _call_receiver(receiver: Callable[..., Any], arity: int, name: str, value: Any) -> None:
+    if arity == 2:
+        receiver(name, value)
+    elif arity == 1:
+        receiver(value)
+    else:
+        receiver()
+
+
+def _load_checked(
+    state: dict[str, Any], name: str, expected_type: type[T], error_msg: str | None, nullable: bool
+) -> tuple[bool, Any]:
+    try:
+        value = state[name]
+        if not isinstance(value, expected_type) and not (nullable and value is None):
+            raise TypeError
+    except (KeyError, TypeError) as e:
+        logging.error(e)
+        # report the caller of try_load/try_load_setter, two frames up
+        logging.warning(storage_err_msg(name, 2) if error_msg is None else error_msg)
+        return False, None
+
+    return True, value
+
+
 @overload
 def try_load(
     state: dict[str, Any], name: str, expected_type: type[T],
@@ -565,22 +649,13 @@ def try_load(
     receiver: T | _OneArgumentFunction | _SetterFunction | None = None,
     error_msg: str | None = None, nullable: bool = False
 ) -> None:
-    import logging
+    loaded, value = _load_checked(state, name, expected_type, error_msg, nullable)
 
-    if error_msg is None:
-        error_msg = storage_err_msg(name, 1)
-
-    try:
-        value = state[name]
-        if not isinstance(value, expected_type) and not (nullable and value is None):
-            raise TypeError
-    except (KeyError, TypeError) as e:
-        logging.error(e)
-        logging.warning(error_msg)
+    if not loaded:
         return
-    finally:
-        if nullable:
-            value = None
+
+    if nullable:
+        value = None
 
     if receiver is None:
         return value
@@ -588,36 +663,31 @@ def try_load(
     if isinstance(receiver, expected_type):
         receiver = value
     elif callable(receiver):
-        from inspect import Signature, _ParameterKind
+        arity_cache, arity_key = _receiver_arity_cache(receiver)
 
-        try:
-            len_params = len([
-                x for x in Signature.from_callable(receiver).parameters.values()
-                if x.kind in (_ParameterKind.POSITIONAL_ONLY, _ParameterKind.POSITIONAL_OR_KEYWORD)
-            ])
-
-            if len_params >= 2:
-                param_tries = [2, 1, 0]
-            elif len_params >= 1:
-                param_tries = [1, 0, 2]
-            else:
-                param_tries = [0, 1, 2]
-        except ValueError:
-            param_tries = [2, 1, 0]
+        if (arity := arity_cache.get(arity_key)) is None:
+            arity = _receiver_arity(receiver)
+
+        if arity is not None:
+            arity_cache[arity_key] = arity
+
+            try:
+                _call_receiver(receiver, arity, name, value)
+            except Exception as e:
+                return main_window().handle_error(e)
+
+            return
 
+        # the signature can't be inspected, find the one that works and remember it
         exceptions = []
 
-        for ptry in param_tries:
+        for ptry in (2, 1, 0):
             try:
-                if ptry == 2:
-                    receiver(name, value)
-                elif ptry == 1:
-                    receiver(value)
-                elif ptry == 0:
-                    receiver()
+                _call_receiver(receiver, ptry, name, value)
             except Exception as e:
                 exceptions.append(e)
             else:
+                arity_cache[arity_key] = ptry
                 exceptions.clear()
                 break
 
@@ -632,4 +702,19 @@ def try_load(
             receiver.__setattr__(name, value)
         except AttributeError as e:
             logging.error(e)
-            logging.warning(error_msg)
+            logging.warning(storage_err_msg(name, 1) if error_msg is None else error_msg)
+
+
+def try_load_setter(
+    state: dict[str, Any], name: str, expected_type: type[T], setter: Callable[[T], Any],
+    error_msg: str | None = None, nullable: bool = False
+) -> None:
+    loaded, value = _load_checked(state, name, expected_type, error_msg, nullable)
+
+    if not loaded:
+        return
+
+    try:
+        setter(value)
+    except Exception as e:
+        main_window().handle_error(e)
@@ -5,12 +5,18 @@ from typing import TYPE_CHECKING, Any, cast, no_type_check
 
 from PyQt6 import sip
 from yaml import AliasEvent, SafeLoader, ScalarNode, YAMLObject, YAMLObjectMetaclass
+from yaml.composer import ComposerError
 
 try:
     from yaml import CDumper as yaml_Dumper
 except ImportError:
     from yaml import Dumper as yaml_Dumper  # type: ignore
 
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    CSafeLoader = None  # type: ignore
+
 if TYPE_CHECKING:
     from jetpytools import T
 
@@ -28,6 +34,9 @@ __all__ = [
 
 
 class SaferLoader(SafeLoader):     # type: ignore
+    yaml_constructors = SafeLoader.yaml_constructors.copy()
+    yaml_multi_constructors = SafeLoader.yaml_multi_constructors.copy()
+
     def compose_node(self, parent, index):
         if self.check_event(AliasEvent):
             event = self.peek_event()
@@ -37,7 +46,35 @@ class SaferLoader(SafeLoader):     # type: ignore
                 return ScalarNode("tag:yaml.org,2002:null", "null")
         return super().compose_node(parent, index)
 
-yaml_Loader = SaferLoader
+
+if CSafeLoader is not None:
+    class CSaferLoader(CSafeLoader):  # type: ignore
+        # share the constructor tables so registering on either loader registers on both
+        yaml_constructors = SaferLoader.yaml_constructors
+        yaml_multi_constructors = SaferLoader.yaml_multi_constructors
+
+        def __init__(self, stream: Any) -> None:
+            super().__init__(stream)
+            self._stream = stream
+
+        def get_single_data(self) -> Any:
+            # libyaml composes the whole document before constructing anything,
+            # so falling back to the pure python loader here has no side effects
+            try:
+                return super().get_single_data()
+            except ComposerError as e:
+                if e.problem != 'found undefined alias' or not isinstance(self._stream, (str, bytes)):
+                    raise
+
+            loader = SaferLoader(self._stream)
+            try:
+                return loader.get_single_data()
+            finally:
+                loader.dispose()
+
+    yaml_Loader: type[SafeLoader] = CSaferLoader  # type: ignore
+else:
+    yaml_Loader = SaferLoader
 
 
 class SingletonMeta(type):
@@ -86,7 +123,8 @@ yaml_Loader.add_multi_constructor('tag:yaml.org,2002:python/object', lambda self
 
 
 class SafeYAMLObject(YAMLObject, metaclass=SafeYAMLObjectMetaclass):
-    pass
+    yaml_loader = yaml_Loader
+    yaml_dumper = yaml_Dumper
 
 
 class AbstractYAMLObjectMeta(SafeYAMLObjectMetaclass, ABCMeta):
@@ -122,7 +160,8 @@ class QYAMLObjectMeta(SafeYAMLObjectMetaclass, sip.wrappertype):
 
 
 class QYAMLObject(YAMLObject, metaclass=QYAMLObjectMeta):
-    pass
+    yaml_loader = yaml_Loader
+    yaml_dumper = yaml_Dumper
 
 
 class QYAMLObjectSingletonMeta(QSingletonMeta, QYAMLObjectMeta):
@@ -29,19 +29,19 @@ class FrameEdit(SpinBox):
         self.valueChanged.emit(self.value(), self.oldValue)
 
     def value(self) -> Frame:  # type: ignore[override]
-        return Frame(super().value())
+        return Frame._from_raw(super().value())
 
     def setValue(self, newValue: Frame) -> None:  # type: ignore[override]
         super().setValue(int(newValue))
 
     def minimum(self) -> Frame:  # type: ignore[override]
-        return Frame(super().minimum())
+        return Frame._from_raw(super().minimum())
 
     def setMinimum(self, newValue: Frame) -> None:  # type: ignore[override]
         super().setMinimum(int(newValue))
 
     def maximum(self) -> Frame:  # type: ignore[override]
-        return Frame(super().maximum())
+        return Frame._from_raw(super().maximum())
 
     def setMaximum(self, newValue: Frame) -> None:  # type: ignore[override]
         super().setMaximum(int(newValue))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..bases import SafeYAMLObject
 
@@ -43,11 +43,13 @@ class ArInfo(SafeYAMLObject):
         _arinfo_active = active
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoOutputNode:
     clip: vs.VideoNode
     alpha: vs.VideoNode | None
     cache: bool = False
+    original_clip: vs.VideoNode = field(init=False, repr=False, compare=False)
+    original_alpha: vs.VideoNode | None = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.original_clip = self.clip
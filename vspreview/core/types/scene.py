@@ -53,21 +53,18 @@ class Scene(YAMLObjectWrapper):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Scene):
             raise NotImplementedError
-        return self.start == other.start and self.end == other.end
+        return self.start.value == other.start.value and self.end.value == other.end.value
 
-    def __gt__(self, other: object) -> bool:
+    def __lt__(self, other: object) -> bool:
         if not isinstance(other, Scene):
             raise NotImplementedError
-        if self.start != other.start:
-            return self.start > other.start
-        else:
-            return self.end > other.end
+        return (self.start.value, self.end.value) < (other.start.value, other.end.value)
 
     def duration(self) -> Frame:
         return self.end - self.start
 
     def __contains__(self, frame: Frame) -> bool:
-        return self.start <= frame <= self.end
+        return self.start.value <= int(frame) <= self.end.value
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         try:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import Any, SupportsFloat, SupportsInt, Union, cast
+from operator import attrgetter
+from typing import Any, Callable, SupportsFloat, SupportsInt, Union, cast
 
 from ..abstracts import main_window, try_load
 from ..bases import yaml_Loader
@@ -20,10 +21,16 @@ class Frame(YAMLObjectWrapper):
     __slots__ = ('value',)
 
     def __init__(self, init_value: Number | Frame | Time | None = 0) -> None:
-        if isinstance(init_value, float):
-            init_value = int(init_value)
-        if isinstance(init_value, int):
+        # plain ints are by far the most common, other exact types are resolved with a single lookup
+        # and subclasses fall back to the isinstance checks
+        if type(init_value) is int:
             self.value = init_value
+        elif (handler := _frame_init_handlers.get(type(init_value))) is not None:
+            self.value = handler(init_value)
+        elif isinstance(init_value, int):
+            self.value = init_value
+        elif isinstance(init_value, float):
+            self.value = int(init_value)
         elif isinstance(init_value, Frame):
             self.value = init_value.value
         elif isinstance(init_value, Time):
@@ -34,7 +41,7 @@ class Frame(YAMLObjectWrapper):
     def __add__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
             other = Frame(other)
-        return Frame(self.value + other.value)
+        return Frame._from_raw(self.value + other.value)
 
     def __iadd__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
@@ -44,7 +51,7 @@ class Frame(YAMLObjectWrapper):
 
     def __sub__(self, other: Number | Frame) -> Frame:
         if isinstance(other, Frame):
-            return Frame(self.value - other.value)
+            return Frame._from_raw(self.value - other.value)
         return self - Frame(other)
 
     def __isub__(self, other: Number | Frame) -> Frame:
@@ -56,7 +63,7 @@ class Frame(YAMLObjectWrapper):
     def __mul__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
             other = Frame(other)
-        return Frame(self.value * other.value)
+        return Frame._from_raw(self.value * other.value)
 
     def __imul__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
@@ -67,12 +74,12 @@ class Frame(YAMLObjectWrapper):
     def __rmul__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
             other = Frame(other)
-        return Frame(other.value * self.value)
+        return Frame._from_raw(other.value * self.value)
 
     def __floordiv__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
             other = Frame(other)
-        return Frame(int(self.value // other.value))
+        return Frame._from_raw(int(self.value // other.value))
 
     def __ifloordiv__(self, other: Number | Frame) -> Frame:
         if not isinstance(other, Frame):
@@ -94,13 +101,16 @@ class Time(YAMLObjectWrapper):
     __slots__ = ('value', )
 
     def __init__(self, init_value: int | Time | timedelta | Frame | None = None, **kwargs: Any):
-        if isinstance(init_value, int):
-            init_value = Frame(init_value)
+        handler = _time_init_handlers.get(type(init_value))
 
-        if isinstance(init_value, timedelta):
+        if handler is not None:
+            self.value = handler(init_value)
+        elif isinstance(init_value, timedelta):
             self.value = init_value
         elif isinstance(init_value, Time):
             self.value = init_value.value
+        elif isinstance(init_value, int):
+            self.value = main_window().current_output.to_time(Frame(init_value)).value
         elif isinstance(init_value, Frame):
             self.value = main_window().current_output.to_time(init_value).value
         elif any(kwargs):
@@ -111,7 +121,7 @@ class Time(YAMLObjectWrapper):
             raise TypeError
 
     def __add__(self, other: Time) -> Time:
-        return Time(self.value + other.value)
+        return Time._from_raw(self.value + other.value)
 
     def __iadd__(self, other: Time) -> Time:
         self.value += other.value
@@ -119,7 +129,7 @@ class Time(YAMLObjectWrapper):
 
     def __sub__(self, other: int | Time | timedelta | Frame | None) -> Time:
         if isinstance(other, Time):
-            return Time(self.value - other.value)
+            return Time._from_raw(self.value - other.value)
         return self - Time(other)
 
     def __isub__(self, other: int | Time | timedelta | Frame | None) -> Time:
@@ -129,17 +139,17 @@ class Time(YAMLObjectWrapper):
         return self
 
     def __mul__(self, other: int) -> Time:
-        return Time(self.value * other)
+        return Time._from_raw(self.value * other)
 
     def __imul__(self, other: int) -> Time:
         self.value *= other
         return self
 
     def __rmul__(self, other: int) -> Time:
-        return Time(other * self.value)
+        return Time._from_raw(other * self.value)
 
     def __truediv__(self, other: float) -> Time:
-        return Time(self.value / other)
+        return Time._from_raw(self.value / other)
 
     def __itruediv__(self, other: float) -> Time:
         self.value /= other
@@ -176,3 +186,25 @@ class Time(YAMLObjectWrapper):
 
     def __hash__(self) -> int:
         return hash(self.value)
+
+
+def _frame_from_time(time: Time) -> int:
+    return main_window().current_output.to_frame(time).value
+
+
+def _time_from_frame(frame: Frame) -> timedelta:
+    return main_window().current_output.to_time(frame).value
+
+
+_frame_init_handlers: dict[type, Callable[[Any], int]] = {
+    float: int,
+    Frame: attrgetter('value'),
+    Time: _frame_from_time,
+}
+
+_time_init_handlers: dict[type, Callable[[Any], timedelta]] = {
+    timedelta: lambda value: value,
+    Time: attrgetter('value'),
+    int: lambda value: _time_from_frame(Frame(value)),
+    Frame: _time_from_frame,
+}
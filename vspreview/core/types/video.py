@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import logging
 import os
-from ctypes import Array
+from datetime import timedelta
 from fractions import Fraction
 from itertools import count as iter_count
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import vapoursynth as vs
 from PyQt6 import sip
@@ -13,12 +13,14 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColorSpace, QImage, QPainter, QPixmap
 from jetpytools import classproperty, fallback
 
-from ..abstracts import AbstractYAMLObject, main_window, try_load
+from ..abstracts import AbstractYAMLObject, main_window, storage_err_msg
 from ..bases import yaml_Loader
 from .misc import ArInfo, CroppingInfo, VideoOutputNode
 from .units import Frame, Time
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from vstools import VideoFormatT
 
     from ..custom.graphicsview import GraphicsImageItem
@@ -39,8 +41,6 @@ class PackingTypeInfo:
     def __init__(
         self, name: str, vs_format: VideoFormatT, qt_format: QImage.Format, shuffle: bool, can_playback: bool = True
     ):
-        from ctypes import c_char
-
         self.id = next(self._getid)
         self.name = name
         self.vs_format = vs.core.get_video_format(vs_format)
@@ -49,10 +49,9 @@ class PackingTypeInfo:
         self.shuffle = shuffle
         self.can_playback = can_playback
 
-        nbps, abps = self.vs_format.bits_per_sample, self.vs_alpha_format.bytes_per_sample
-        self.conv_info: dict[bool, tuple[type[Array[c_char]], QImage.Format]] = {
-            False: (c_char * nbps, self.qt_format),
-            True: (c_char * abps, QImage.Format.Format_Alpha8)
+        self.conv_info: dict[bool, QImage.Format] = {
+            False: self.qt_format,
+            True: QImage.Format.Format_Alpha8
         }
 
     def __eq__(self, other: object) -> bool:
@@ -91,14 +90,20 @@ class PackingType():
 
 
 class VideoOutput(AbstractYAMLObject):
-    storable_attrs = (
-        'name', 'last_showed_frame', 'play_fps', 'crop_values', 'ar_values'
+    _storable_types: ClassVar[tuple[tuple[str, type], ...]] = (
+        ('name', str),
+        ('last_showed_frame', Frame),
+        ('play_fps', Fraction),
+        ('crop_values', CroppingInfo),
+        ('ar_values', ArInfo),
     )
 
+    storable_attrs = tuple(name for name, _ in _storable_types)
+
     __slots__ = (
         *storable_attrs, 'index', 'width', 'height', 'fps_num', 'fps_den',
         'total_frames', 'total_time',
-        'end_frame', 'fps', 'source', 'prepared',
+        'end_frame', 'fps', '_inv_fps', 'source', 'prepared',
         'main', 'checkerboard', 'props', '_stateset'
     )
 
@@ -164,7 +169,9 @@ class VideoOutput(AbstractYAMLObject):
         self.fps_num = self.prepared.clip.fps.numerator
         self.fps_den = self.prepared.clip.fps.denominator
         self.fps = self.fps_num / self.fps_den
-        self.total_frames = Frame(self.prepared.clip.num_frames)
+        self._inv_fps = 1.0 / (self.fps or 1.0)
+        num_frames = self.prepared.clip.num_frames
+        self.total_frames = Frame._from_raw(num_frames)
 
         self.name = self.info.get('name', 'Video Node %d' % self.vs_index)
 
@@ -176,8 +183,8 @@ class VideoOutput(AbstractYAMLObject):
         if self.source.alpha:
             self.checkerboard = self._generate_checkerboard()
 
-        if not hasattr(self, 'last_showed_frame') or not (0 <= self.last_showed_frame < self.total_frames):
-            self.last_showed_frame = Frame(0)
+        if not hasattr(self, 'last_showed_frame') or not (0 <= self.last_showed_frame.value < num_frames):
+            self.last_showed_frame = Frame._from_raw(0)
 
         if index in self.main.timecodes:
             timecodes, tden = self.main.timecodes[index]
@@ -391,21 +398,16 @@ class VideoOutput(AbstractYAMLObject):
             else:
                 import numpy as np
 
-                ein_shift = np.array([b_shift, g_shift, r_shift], np.uint32)
-
-                from numpy import einsum as c_einsum
-                from numpy import tensordot
-
-                self.__base_numpy_add = base_add = np.asarray(blank.get_frame(0).copy()[0]).copy()
+                plane_shifts = [np.uint32(x) for x in (b_shift, g_shift, r_shift)]
 
                 def _packrgb(n: int, f: list[vs.VideoFrame]) -> vs.VideoFrame:
                     bf = f[0].copy()
+                    packed = np.asarray(bf[0])
 
-                    np.add(
-                        c_einsum(
-                            'ji->ji', tensordot(np.asarray(f[1], np.uint32), ein_shift, ((0,), (0,)))
-                        ), base_add, np.asarray(bf[0])
-                    )
+                    # the blank frame already holds the high bits and the channels don't overlap,
+                    # so or-ing each shifted plane in place is the same as summing them
+                    for i, plane_shift in enumerate(plane_shifts):
+                        packed |= np.multiply(np.asarray(f[1][i]), plane_shift, dtype=np.uint32)
 
                     return bf
 
@@ -417,15 +419,10 @@ class VideoOutput(AbstractYAMLObject):
         return clip
 
     def frame_to_qimage(self, frame: vs.VideoFrame, is_alpha: bool = False) -> QImage:
-        from ctypes import POINTER
-        from ctypes import cast as ccast
-
         width, height, stride = frame.width, frame.height, frame.get_stride(0)
-        point_size, qt_format = PackingType.CURRENT.conv_info[is_alpha]
+        qt_format = PackingType.CURRENT.conv_info[is_alpha]
 
-        pointer = cast(
-            sip.voidptr, ccast(frame.get_read_ptr(0), POINTER(point_size * stride)).contents
-        )
+        pointer = sip.voidptr(frame.get_read_ptr(0).value, stride * height, False)
 
         return QImage(pointer, width, height, stride, qt_format).copy()  # type: ignore
 
@@ -483,7 +480,13 @@ class VideoOutput(AbstractYAMLObject):
         if frame is None or not self._stateset:
             return QPixmap()
 
-        frame = min(max(frame, Frame(0)), self.total_frames - 1)
+        frame = Frame._from_raw(min(max(int(frame), 0), self.total_frames.value - 1))
+
+        alpha_future: Future[vs.VideoFrame] | None = None
+
+        # request the alpha first so that it renders alongside the clip instead of after it
+        if self.prepared.alpha is not None and not vs_alpha_frame:
+            alpha_future = self.prepared.alpha.get_frame_async(frame.value)
 
         if not vs_frame:
             try:
@@ -515,24 +518,22 @@ class VideoOutput(AbstractYAMLObject):
 
             return qpixmap
 
-        alpha_image = self.frame_to_qimage(
-            vs_alpha_frame or self.prepared.alpha.get_frame(frame.value), True
-        )
+        if alpha_future is not None:
+            vs_alpha_frame = alpha_future.result()
 
-        result_image = QImage(frame_image.size(), QImage.Format.Format_ARGB32_Premultiplied)
-        painter = QPainter(result_image)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-        painter.drawImage(0, 0, frame_image)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
-        painter.drawImage(0, 0, alpha_image)
+        alpha_image = self.frame_to_qimage(cast(vs.VideoFrame, vs_alpha_frame), True)
+
+        # frame_image owns its data, so it can be composited in place instead of into a new image
+        frame_image.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+        frame_image.setAlphaChannel(alpha_image)
 
         if self.main.toolbars.playback.settings.CHECKERBOARD_ENABLED:
+            painter = QPainter(frame_image)
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationOver)
             painter.drawImage(0, 0, self.checkerboard)
+            painter.end()
 
-        painter.end()
-
-        qpixmap = QPixmap.fromImage(result_image, Qt.ImageConversionFlag.NoFormatConversion)
+        qpixmap = QPixmap.fromImage(frame_image, Qt.ImageConversionFlag.NoFormatConversion)
 
         if do_painting:
             self.update_graphic_item(qpixmap, graphics_scene_item=graphics_scene_item)
@@ -592,13 +593,13 @@ class VideoOutput(AbstractYAMLObject):
     def _calculate_seconds(self, frame_num: int) -> float:
         if self.got_timecodes:
             return self._timecodes_frame_to_time[frame_num]
-        return frame_num / (self.fps or 1)
+        return frame_num * self._inv_fps
 
     def to_frame(self, time: Time) -> Frame:
-        return Frame(self._calculate_frame(float(time)))
+        return Frame(self._calculate_frame(time.value.total_seconds()))
 
     def to_time(self, frame: Frame) -> Time:
-        return Time(seconds=self._calculate_seconds(int(frame)))
+        return Time(timedelta(seconds=self._calculate_seconds(int(frame))))
 
     def with_node(self, new_node: vs.VideoNode | VideoOutputNode) -> VideoOutput:
         if isinstance(new_node, vs.VideoNode):
@@ -613,10 +614,13 @@ class VideoOutput(AbstractYAMLObject):
         return new_output
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        try_load(state, 'name', str, self.__setattr__)
-        try_load(state, 'last_showed_frame', Frame, self.__setattr__)
-        try_load(state, 'play_fps', Fraction, self.__setattr__)
-        try_load(state, 'crop_values', CroppingInfo, self.__setattr__)
-        try_load(state, 'ar_values', ArInfo, self.__setattr__)
+        # every attribute is a plain isinstance check and setattr, no need for try_load's receiver handling
+        for name, expected_type in self._storable_types:
+            value = state.get(name)
+
+            if isinstance(value, expected_type):
+                setattr(self, name, value)
+            else:
+                logging.warning(storage_err_msg(name))
 
         self._stateset = True
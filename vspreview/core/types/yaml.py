@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import total_ordering
+from typing import Any, Self
 
 from ..abstracts import AbstractYAMLObject
 
@@ -9,9 +10,17 @@ __all__ = [
 ]
 
 
+@total_ordering
 class YAMLObjectWrapper(AbstractYAMLObject):
     value: Any
 
+    @classmethod
+    def _from_raw(cls, value: Any) -> Self:
+        # skips __init__ and its type dispatching, value must already be of the right type
+        obj = object.__new__(cls)
+        obj.value = value
+        return obj
+
     def __int__(self) -> int:
         return int(self.value)
 
@@ -31,28 +40,12 @@ class YAMLObjectWrapper(AbstractYAMLObject):
             other = self.__class__(other)
         return bool(self.value == other.value)
 
-    def __gt__(self, other: object) -> bool:
-        if other is None:
-            return False
-        if not isinstance(other, YAMLObjectWrapper):
-            other = self.__class__(other)
-        return bool(self.value > other.value)
-
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
-
-    def __le__(self, other: object) -> bool:
-        return not self.__gt__(other)
-
-    def __ge__(self, other: object) -> bool:
+    def __lt__(self, other: object) -> bool:
         if other is None:
-            return False
+            return NotImplemented
         if not isinstance(other, YAMLObjectWrapper):
             other = self.__class__(other)
-        return self.__eq__(other) or self.__gt__(other)
-
-    def __lt__(self, other: object) -> bool:
-        return not self.__ge__(other)
+        return bool(self.value < other.value)
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.value})'
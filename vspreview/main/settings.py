@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from functools import partial
+from functools import lru_cache, partial
 from multiprocessing import cpu_count
 from typing import Any, cast
 
@@ -229,7 +229,9 @@ class MainSettings(AbstractToolbarSettings):
     def zoom_default_index(self) -> int:
         return self.zoom_level_default_combobox.currentIndex()
 
+    # process affinity doesn't change during a session, use cache_clear() to query it again
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_usable_cpus_count() -> int:
         from os import getpid
         try:
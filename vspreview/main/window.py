@@ -25,7 +25,7 @@ from ..core import (
     GraphicsImageItem, GraphicsView, HBoxLayout, MainVideoOutputGraphicsView, PushButton,
     QAbstractYAMLObjectSingleton, StatusBar, Time, Timer, VBoxLayout, VideoOutput,
     _monkey_runpy_dicts, apply_plotting_style, dispose_environment, get_current_environment,
-    make_environment
+    make_environment, register_main_window
 )
 from ..models import GeneralModel, SceningList, VideoOutputs
 from ..plugins import FileResolverPlugin, Plugins
@@ -128,6 +128,8 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
         super().__init__()
 
+        register_main_window(self)
+
         self.move_legacy_vspdir()
         self.move_legacy_global_storage()
 
@@ -4,6 +4,7 @@ from bisect import bisect_right
 from copy import deepcopy
 from typing import Any, Iterator
 
+import numpy as np
 from PyQt6.QtCore import QAbstractListModel, QAbstractTableModel, QModelIndex, Qt
 
 from ..core import Frame, QYAMLObject, Scene, Time, main_window
@@ -33,9 +34,34 @@ class SceningList(QAbstractTableModel, QYAMLObject):
         self.max_value = max_value if max_value is not None else Frame(2**31)
         self.items = items if items is not None else []
         self.temporary = temporary
+        self._bounds: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
 
         self.main = main_window()
 
+    def _get_bounds(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # items aren't guaranteed to be sorted, so the bounds are sorted by start and the running
+        # maximum of the ends makes those sorted too, so that lookups are a single binary search
+        if self._bounds is None:
+            starts = np.fromiter((scene.start.value for scene in self.items), np.int64, len(self.items))
+            ends = np.fromiter((scene.end.value for scene in self.items), np.int64, len(self.items))
+
+            order = np.argsort(starts, kind='stable')
+            starts, ends = starts[order], ends[order]
+
+            self._bounds = (order, starts, np.maximum.accumulate(ends) if len(ends) else ends)
+
+        return self._bounds
+
+    def scene_at(self, frame: Frame | int) -> int:
+        order, starts, max_ends = self._get_bounds()
+
+        i = int(np.searchsorted(max_ends, int(frame), 'left'))
+
+        if i < len(starts) and starts[i] <= int(frame):
+            return int(order[i])
+
+        return -1
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self.items)
 
@@ -157,9 +183,11 @@ class SceningList(QAbstractTableModel, QYAMLObject):
                 self.beginMoveRows(self.createIndex(row, 0), row, row, self.createIndex(i, 0), i)
                 del self.items[row]
                 self.items.insert(i, scene)
+                self._bounds = None
                 self.endMoveRows()
             else:
                 self.items[index.row()] = scene
+                self._bounds = None
                 self.dataChanged.emit(index, index)
         else:
             self.items[index.row()] = scene
@@ -177,16 +205,14 @@ class SceningList(QAbstractTableModel, QYAMLObject):
             raise IndexError
 
         self.items[i] = value
+        self._bounds = None
         self.dataChanged.emit(self.createIndex(i, 0), self.createIndex(i, self.COLUMN_COUNT - 1))
 
     def __contains__(self, item: Scene | Frame) -> bool:
         if isinstance(item, Scene):
             return item in self.items
         if isinstance(item, Frame):
-            for scene in self.items:
-                if item in scene:
-                    return True
-            return False
+            return self.scene_at(item) != -1
         raise TypeError
 
     def __iter__(self) -> Iterator[Scene]:
@@ -204,6 +230,7 @@ class SceningList(QAbstractTableModel, QYAMLObject):
         index = bisect_right(self.items, scene)
         self.beginInsertRows(QModelIndex(), index, index)
         self.items.insert(index, scene)
+        self._bounds = None
         self.endInsertRows()
 
         return scene
@@ -215,6 +242,7 @@ class SceningList(QAbstractTableModel, QYAMLObject):
         if i >= 0 and i < len(self.items):
             self.beginRemoveRows(QModelIndex(), i, i)
             del self.items[i]
+            self._bounds = None
             self.endRemoveRows()
         else:
             raise IndexError
@@ -4,7 +4,7 @@ from typing import Any
 
 from PyQt6.QtWidgets import QLabel
 
-from ...core import AbstractToolbarSettings, CheckBox, HBoxLayout, SpinBox, Time, TimeEdit, try_load
+from ...core import AbstractToolbarSettings, CheckBox, HBoxLayout, SpinBox, Time, TimeEdit, try_load_setter
 
 __all__ = [
     'BenchmarkSettings'
@@ -87,7 +87,7 @@ class BenchmarkSettings(AbstractToolbarSettings):
         }
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        try_load(state, 'clear_cache_enabled', bool, self.clear_cache_checkbox.setChecked)
-        try_load(state, 'log_results_enabled', bool, self.log_results_checkbox.setChecked)
-        try_load(state, 'refresh_interval', Time, self.refresh_interval_control.setValue)
-        try_load(state, 'frame_data_sharing_fix_enabled', bool, self.frame_data_sharing_fix_checkbox.setChecked)
+        try_load_setter(state, 'clear_cache_enabled', bool, self.clear_cache_checkbox.setChecked)
+        try_load_setter(state, 'log_results_enabled', bool, self.log_results_checkbox.setChecked)
+        try_load_setter(state, 'refresh_interval', Time, self.refresh_interval_control.setValue)
+        try_load_setter(state, 'frame_data_sharing_fix_enabled', bool, self.frame_data_sharing_fix_checkbox.setChecked)
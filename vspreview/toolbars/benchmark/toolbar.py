@@ -3,18 +3,20 @@ from __future__ import annotations
 import csv
 import logging
 from collections import deque
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import count
+from threading import Lock
 from time import perf_counter
 from typing import TYPE_CHECKING
 
 import vapoursynth as vs
 from jetpytools import SPath
-from PyQt6.QtCore import QMetaObject, Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import QLabel
 
 from ...core import AbstractToolbar, CheckBox, Frame, PushButton, SpinBox, Time, Timer
 from ...core.custom import FrameEdit
-from ...utils import qt_silent_call, strfdelta
+from ...utils import qt_silent_calls, strfdelta
 from .settings import BenchmarkSettings
 
 if TYPE_CHECKING:
@@ -38,10 +40,13 @@ class BenchmarkToolbar(AbstractToolbar):
         'run_abort_button', 'info_label', 'running',
         'unsequenced', 'run_start_time', 'start_frame',
         'end_frame', 'total_frames', 'buffer',
-        'update_info_timer', 'sequenced_timer',
-        'benchmark_data'
+        'update_info_timer', 'benchmark_data',
+        '_next_frames', '_end_frame_int', '_total_frames_int', '_frames_done_lock'
     )
 
+    sequenced_frame_done = pyqtSignal(object)
+    unsequenced_abort_requested = pyqtSignal()
+
     settings: BenchmarkSettings
 
     def __init__(self, main: MainWindow) -> None:
@@ -51,18 +56,27 @@ class BenchmarkToolbar(AbstractToolbar):
 
         self.running = False
         self.unsequenced = False
-        self.buffer = deque[Future[vs.VideoFrame]]()
+        self.buffer = deque[Future[vs.VideoFrame]](maxlen=1)
         self.run_start_time = 0.0
         self.start_frame = Frame(0)
         self.end_frame = Frame(0)
         self.total_frames = Frame(0)
         self.benchmark_data = None
 
-        self.sequenced_timer = Timer(
-            timeout=self._request_next_frame_sequenced, timerType=Qt.TimerType.PreciseTimer, interval=0
+        # plain ints for the request loops, the next frame counter is shared by every VS callback thread
+        self._next_frames = count()
+        self._end_frame_int = 0
+        self._total_frames_int = 0
+        # unsequenced completions are counted from several VS callback threads at once
+        self._frames_done_lock = Lock()
+
+        self.sequenced_frame_done.connect(
+            self._request_next_frame_sequenced, Qt.ConnectionType.QueuedConnection
         )
+        # unsequenced callbacks run on VapourSynth threads, abort() has to run on the GUI thread
+        self.unsequenced_abort_requested.connect(self.abort, Qt.ConnectionType.QueuedConnection)
 
-        self.update_info_timer = Timer(timeout=self.update_info, timerType=Qt.TimerType.PreciseTimer)
+        self.update_info_timer = Timer(timeout=self.update_info, timerType=Qt.TimerType.CoarseTimer)
 
         self.main.reload_before_signal.connect(self.abort)
 
@@ -138,15 +152,17 @@ class BenchmarkToolbar(AbstractToolbar):
         self.end_frame = self.end_frame_control.value()
         self.total_frames = self.total_frames_control.value()
 
+        self._next_frames = count(int(self.start_frame))
+        self._end_frame_int = int(self.end_frame)
+        self._total_frames_int = int(self.total_frames)
+
         if self.prefetch_checkbox.isChecked():
             concurrent_requests_count = self.usable_cpus_spinbox.value()
         else:
             concurrent_requests_count = 1
 
         self.unsequenced = self.unsequenced_checkbox.isChecked()
-        if not self.unsequenced:
-            self.buffer = deque([], concurrent_requests_count)
-            self.sequenced_timer.start()
+        self.buffer = deque(maxlen=concurrent_requests_count)
 
         self.running = True
         self.run_start_time = perf_counter()
@@ -171,13 +187,19 @@ class BenchmarkToolbar(AbstractToolbar):
 
         self.update_info()
 
-        for offset in range(min(int(self.end_frame - self.frames_done), concurrent_requests_count)):
-            if self.unsequenced:
-                self._request_next_frame_unsequenced()
-            else:
-                self.buffer.appendleft(
-                    self.main.current_output.source.original_clip.get_frame_async(self.start_frame + offset)
-                )
+        clip = self.main.current_output.source.original_clip
+        initial_requests = [
+            clip.get_frame_async(next(self._next_frames))
+            for _ in range(min(self._total_frames_int, concurrent_requests_count))
+        ]
+
+        # everything is submitted before the first callback can request more frames
+        if self.unsequenced:
+            for future in initial_requests:
+                future.add_done_callback(self._request_next_frame_unsequenced)
+        else:
+            self.buffer.extendleft(initial_requests)
+            self._wait_next_frame_sequenced()
 
         self.update_info_timer.setInterval(round(float(self.settings.refresh_interval) * 1000))
         self.update_info_timer.start()
@@ -188,39 +210,75 @@ class BenchmarkToolbar(AbstractToolbar):
             self._save_benchmark_results()
 
         self.running = False
-        QMetaObject.invokeMethod(self.update_info_timer, 'stop', Qt.ConnectionType.QueuedConnection)
+        self.update_info_timer.stop()
 
         if self.run_abort_button.isChecked():
             self.run_abort_button.click()
 
-    def _request_next_frame_sequenced(self) -> None:
-        if self.frames_done >= (self.end_frame - self.start_frame):
+    def _on_sequenced_frame_done(self, future: Future[vs.VideoFrame]) -> None:
+        # runs on a VapourSynth thread, the queued signal moves the work back to the GUI thread
+        self.sequenced_frame_done.emit(future)
+
+    def _wait_next_frame_sequenced(self) -> None:
+        if self.buffer:
+            self.buffer[-1].add_done_callback(self._on_sequenced_frame_done)
+        else:
+            self.sequenced_frame_done.emit(None)
+
+    def _request_next_frame_sequenced(self, future: Future[vs.VideoFrame] | None = None) -> None:
+        # completions left over from an aborted run don't belong to the current buffer
+        if not self.running or (future is not None and (not self.buffer or self.buffer[-1] is not future)):
+            return
+
+        if self.frames_done >= self._total_frames_int or not self.buffer:
+            self.abort()
+            return
+
+        # this runs in a slot, an exception escaping it would take the whole app down
+        try:
+            self.buffer.pop().result()
+        except Exception as e:
+            logging.error(e)
             self.abort()
             return
 
-        self.buffer.pop().result()
+        self.frames_done += 1
 
-        if (next_frame := self.start_frame + self.frames_done + 1) <= self.end_frame:
+        if (next_frame := next(self._next_frames)) <= self._end_frame_int:
             self.buffer.appendleft(
                 self.main.current_output.source.original_clip.get_frame_async(next_frame)
             )
 
-        self.frames_done += 1
+        self._wait_next_frame_sequenced()
 
     def _request_next_frame_unsequenced(self, future: Future[vs.VideoFrame] | None = None) -> None:
-        if self.frames_done >= self.total_frames:
-            self.abort()
+        # add_done_callback already calls us inline when the frame was done before it was attached
+        if future is not None:
+            if not self.running:
+                return
+
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(e)
+                self.unsequenced_abort_requested.emit()
+                return
+
+        with self._frames_done_lock:
+            if future is not None:
+                self.frames_done += 1
+
+            finished = self.frames_done >= self._total_frames_int
+
+        if finished:
+            self.unsequenced_abort_requested.emit()
             return
 
-        if self.running:
+        if self.running and (next_frame := next(self._next_frames)) <= self._end_frame_int:
             self.main.current_output.source.original_clip.get_frame_async(
-                self.start_frame + self.frames_done + 1
+                next_frame
             ).add_done_callback(self._request_next_frame_unsequenced)
 
-        if future is not None:
-            future.result()
-            self.frames_done += 1
-
     def on_run_abort_pressed(self, checked: bool) -> None:
         self.set_ui_editable(not checked)
         if checked:
@@ -282,16 +340,22 @@ class BenchmarkToolbar(AbstractToolbar):
         else:
             return
 
-        qt_silent_call(self.start_frame_control.setValue, start)
-        qt_silent_call(self.end_frame_control.setValue, end)
-        qt_silent_call(self.total_frames_control.setValue, total)
+        qt_silent_calls(*(
+            (control.setValue, value) for control, value in (
+                (self.start_frame_control, start),
+                (self.end_frame_control, end),
+                (self.total_frames_control, total)
+            ) if control.value() != value
+        ))
 
     def update_info(self) -> None:
-        run_time = Time(seconds=(perf_counter() - self.run_start_time))
-        fps = int(self.frames_done) / float(run_time)
+        frames_done = self.frames_done
+        elapsed = perf_counter() - self.run_start_time
+        fps = frames_done / elapsed if elapsed > 0 else 0.0
+        run_time = Time._from_raw(timedelta(seconds=elapsed))
 
         self.info_label.setText(
-            f"{self.frames_done}/{self.total_frames} frames in {strfdelta(run_time, '%M:%S.%Z')}, {fps:.4f} fps"
+            f"{frames_done}/{self.total_frames} frames in {strfdelta(run_time, '%M:%S.%Z')}, {fps:.4f} fps"
         )
 
     def _save_benchmark_results(self) -> None:
@@ -4,7 +4,6 @@ import json
 import logging
 import re
 from bisect import bisect_left
-from copy import deepcopy
 from pathlib import Path
 
 from ...core import Frame, Time
@@ -164,7 +163,7 @@ def import_lwi(path: Path, scening_list: SceningList) -> int:
             continue
 
         try:
-            scening_list.add(deepcopy(frame))
+            scening_list.add(Frame(frame))
         except ValueError:
             out_of_range_count += 1
 
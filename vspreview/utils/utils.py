@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import re
 import sys
-from functools import partial, wraps
-from string import Template
+from datetime import timedelta
+from functools import lru_cache, partial, wraps
 from typing import TYPE_CHECKING, Any, Callable
 
 from PyQt6.QtCore import QSignalBlocker, QTime
@@ -18,6 +19,7 @@ __all__ = [
     'strfdelta',
 
     'qt_silent_call',
+    'qt_silent_calls',
     'fire_and_forget',
 
     'set_status_label',
@@ -42,29 +44,55 @@ def qt_silent_call(qt_method: Callable[P, R], *args: P.args, **kwargs: P.kwargs)
     return ret
 
 
-class DeltaTemplate(Template):
-    delimiter = '%'
+# use this instead of qt_silent_call when setting several widgets at once
+def qt_silent_calls(*calls: tuple[Callable[..., Any], Any]) -> None:
+    if not calls:
+        return
+
+    widgets = {qt_method.__self__: None for qt_method, _ in calls}  # type: ignore
+    was_blocked = [widget.blockSignals(True) for widget in widgets]
+
+    try:
+        for qt_method, value in calls:
+            qt_method(value)
+    finally:
+        for widget, blocked in zip(widgets, was_blocked):
+            widget.blockSignals(blocked)
+
+
+_delta_format_specs = {
+    'D': '{D:d}', 'H': '{H:02d}', 'M': '{M:02d}', 'S': '{S:02d}',
+    'Z': '{Z:03d}', 'h': '{H:d}', 'm': '{M:2d}', 's': '{S:2d}'
+}
+
+_delta_format_tokens = re.compile(r'%([%DHMSZhms])|([{}])')
+
+
+def _delta_format_token(match: re.Match[str]) -> str:
+    if (brace := match[2]) is not None:
+        return brace * 2
+
+    return '%' if match[1] == '%' else _delta_format_specs[match[1]]
+
+
+@lru_cache(maxsize=32)
+def _delta_format(output_format: str) -> str:
+    # '%M:%S.%Z' -> '{M:02d}:{S:02d}.{Z:03d}', unknown %X tokens are kept as they are
+    return _delta_format_tokens.sub(_delta_format_token, output_format)
 
 
 def strfdelta(time: Time, output_format: str) -> str:
-    seconds = time.value.seconds % (24 * 3600)
-    hours = seconds // 3600
-    seconds %= 3600
-    minutes = seconds // 60
-    seconds %= 60
+    hours, seconds = divmod(time.value.seconds % (24 * 3600), 3600)
+    minutes, seconds = divmod(seconds, 60)
     milliseconds = time.value.microseconds // 1000
 
-    template = DeltaTemplate(output_format)
-
-    return template.substitute(
-        D='{:d}'.format(time.value.days),
-        H='{:02d}'.format(hours),
-        M='{:02d}'.format(minutes),
-        S='{:02d}'.format(seconds),
-        Z='{:03d}'.format(milliseconds),
-        h='{:d}'.format(hours),
-        m='{:2d}'.format(minutes),
-        s='{:2d}'.format(seconds)
+    # used by the benchmark toolbar on every refresh
+    if output_format == '%M:%S.%Z':
+        return f'{minutes:02d}:{seconds:02d}.{milliseconds:03d}'
+
+    # format_map only formats the fields the format references, the others stay plain ints
+    return _delta_format(output_format).format_map(
+        {'D': time.value.days, 'H': hours, 'M': minutes, 'S': seconds, 'Z': milliseconds}
     )
 
 
@@ -113,4 +141,4 @@ def to_qtime(time: Time) -> QTime:
 
 
 def from_qtime(qtime: QTime, t: type[Time]) -> Time:
-    return t(milliseconds=qtime.msecsSinceStartOfDay())
+    return t._from_raw(timedelta(milliseconds=qtime.msecsSinceStartOfDay()))